@@ -0,0 +1,15 @@
+#!/bin/bash
+# Compile the Cython benchmark apps in place and serve them
+#
+# Usage: benchmarks/run.sh [asgi|wsgi] [port] [workers] [blocking_threads] [--full]
+set -e
+
+cd "$(dirname "$0")"
+
+KIND="${1:-asgi}"
+[ $# -gt 0 ] && shift
+
+echo "Compiling simple_${KIND}_app_cy.pyx with Cython..."
+cythonize -3 --inplace "simple_${KIND}_app_cy.pyx"
+
+exec python "simple_${KIND}_app.py" "$@" --cython
@@ -1,39 +1,73 @@
 #!/usr/bin/env python3
 """Simple ASGI app for benchmarking (non-streaming)"""
 
+from tsuno import register_headers
 
-async def app(scope, receive, send):
-    """Simple Hello World ASGI app"""
-    if scope["type"] != "http":
-        return
+# Response messages are built once at import time and reused for every request
+_H = [(b"content-type", b"text/plain"), (b"content-length", b"13")]
+# Decoded once by tsuno; tsuno-only messages refer to it by id
+_H_ID = register_headers(_H)
+_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": _H,
+}
+_BODY = {
+    "type": "http.response.body",
+    "body": b"Hello, World!",
+    "more_body": False,
+}
+# Single-message response for servers advertising the "http.response.full" extension (--full)
+_FULL = {
+    "type": "http.response.full",
+    "status": 200,
+    "headers_id": _H_ID,
+    "body": b"Hello, World!",
+}
 
-    await send(
-        {
-            "type": "http.response.start",
-            "status": 200,
-            "headers": [(b"content-type", b"text/plain")],
-        }
-    )
 
-    await send(
-        {
-            "type": "http.response.body",
-            "body": b"Hello, World!",
-            "more_body": False,
-        }
-    )
+async def http_handler(scope, receive, send):
+    """Simple Hello World ASGI handler (registered for "http" scopes only)"""
+    await send(_START)
+    await send(_BODY)
+
+
+async def http_handler_full(scope, receive, send):
+    """Same response sent as one tsuno-only http.response.full message"""
+    if "http.response.full" in scope.get("extensions", {}):
+        await send(_FULL)
+        return
+
+    await send(_START)
+    await send(_BODY)
 
 
 if __name__ == "__main__":
     import sys
 
-    from tsuno import serve
+    from tsuno import serve, static_response
+
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    port = int(args[0]) if len(args) > 0 else 8000
+    workers = int(args[1]) if len(args) > 1 else 7
+    blocking_threads = int(args[2]) if len(args) > 2 else 2
+
+    # --static: answer from a precomputed response without running the ASGI app
+    # --full: send the tsuno-only single-message response (not comparable with
+    #         other servers, which run the standard two-message app)
+    # --cython: use the compiled build of this app (see run.sh)
+    if "--static" in sys.argv[1:]:
+        app = static_response(200, [(b"content-type", b"text/plain")], b"Hello, World!")
+    else:
+        if "--cython" in sys.argv[1:]:
+            from simple_asgi_app_cy import http_handler, http_handler_full
 
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
-    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 7
-    blocking_threads = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+        # Only "http" scopes are dispatched to the handler (no lifespan)
+        app = {"http": http_handler_full if "--full" in sys.argv[1:] else http_handler}
 
     print(f"Starting simple ASGI server on 0.0.0.0:{port}")
+    # Keep one worker process per event loop even on free-threaded builds:
+    # single_process_threads= would run every ASGI request on one event loop
     print(f"Workers: {workers}, Blocking threads: {blocking_threads}")
     serve(
         {"/": app},
@@ -41,6 +75,5 @@ if __name__ == "__main__":
         workers=workers,
         blocking_threads=blocking_threads,
         access_log=False,  # Disable access logging for benchmarks
-        use_uvloop=True,  # Enable uvloop for maximum performance
         timeout=0,  # Disable timeout monitoring for benchmarks (enables fast path)
     )
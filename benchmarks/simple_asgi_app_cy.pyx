@@ -0,0 +1,40 @@
+# cython: language_level=3
+"""Cython build of simple_asgi_app.http_handler (see benchmarks/run.sh)"""
+
+from tsuno import register_headers
+
+cdef list _H = [(b"content-type", b"text/plain"), (b"content-length", b"13")]
+# Decoded once by tsuno; tsuno-only messages refer to it by id
+cdef int _H_ID = register_headers(_H)
+cdef dict _START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": _H,
+}
+cdef dict _BODY = {
+    "type": "http.response.body",
+    "body": b"Hello, World!",
+    "more_body": False,
+}
+cdef dict _FULL = {
+    "type": "http.response.full",
+    "status": 200,
+    "headers_id": _H_ID,
+    "body": b"Hello, World!",
+}
+
+
+async def http_handler(dict scope, receive, send):
+    """Simple Hello World ASGI handler (registered for "http" scopes only)"""
+    await send(_START)
+    await send(_BODY)
+
+
+async def http_handler_full(dict scope, receive, send):
+    """Same response sent as one tsuno-only http.response.full message"""
+    if "http.response.full" in scope.get("extensions", {}):
+        await send(_FULL)
+        return
+
+    await send(_START)
+    await send(_BODY)
@@ -1,13 +1,16 @@
 #!/usr/bin/env python3
 """Simple WSGI app for benchmarking (non-streaming)"""
 
+# Status, headers and body are built once at import time and reused for every request
+_STATUS = "200 OK"
+_HEADERS = [("Content-type", "text/plain"), ("Content-Length", "13")]
+_BODY = [b"Hello, World!"]
+
 
 def app(environ, start_response):
     """Simple Hello World WSGI app"""
-    status = "200 OK"
-    headers = [("Content-type", "text/plain")]
-    start_response(status, headers)
-    return [b"Hello, World!"]
+    start_response(_STATUS, _HEADERS)
+    return _BODY
 
 
 if __name__ == "__main__":
@@ -15,17 +18,30 @@ if __name__ == "__main__":
 
     from tsuno import serve
 
-    port = int(sys.argv[1]) if len(sys.argv) > 1 else 8000
-    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 7
-    blocking_threads = int(sys.argv[3]) if len(sys.argv) > 3 else 2
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    port = int(args[0]) if len(args) > 0 else 8000
+    workers = int(args[1]) if len(args) > 1 else 7
+    blocking_threads = int(args[2]) if len(args) > 2 else 2
+
+    # --cython: use the compiled build of this app (see run.sh)
+    if "--cython" in sys.argv[1:]:
+        from simple_wsgi_app_cy import app as handler
+    else:
+        handler = app
 
     print(f"Starting simple WSGI server on 0.0.0.0:{port}")
-    print(f"Workers: {workers}, Blocking threads: {blocking_threads}")
+    # Free-threaded Python: use one process with the same total number of
+    # threads instead of forking workers
+    if hasattr(sys, "_is_gil_enabled") and not sys._is_gil_enabled():
+        options = {"single_process_threads": workers * blocking_threads}
+        print(f"Free-threaded build, threads: {workers * blocking_threads}")
+    else:
+        options = {"workers": workers, "blocking_threads": blocking_threads}
+        print(f"Workers: {workers}, Blocking threads: {blocking_threads}")
     serve(
-        {"/": app},
+        {"/": handler},
         address=f"0.0.0.0:{port}",
-        workers=workers,
-        blocking_threads=blocking_threads,
+        **options,
         access_log=False,  # Disable access logging for benchmarks
         timeout=0,  # Disable timeout monitoring for benchmarks (enables fast path)
     )
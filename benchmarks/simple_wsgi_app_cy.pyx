@@ -0,0 +1,12 @@
+# cython: language_level=3
+"""Cython build of simple_wsgi_app.app (see benchmarks/run.sh)"""
+
+cdef str _STATUS = "200 OK"
+cdef list _HEADERS = [("Content-type", "text/plain"), ("Content-Length", "13")]
+cdef list _BODY = [b"Hello, World!"]
+
+
+def app(dict environ, start_response):
+    """Simple Hello World WSGI app"""
+    start_response(_STATUS, _HEADERS)
+    return _BODY
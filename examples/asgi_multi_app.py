@@ -5,12 +5,63 @@ Example of mounting multiple ASGI applications with the high-performance server.
 This demonstrates how to serve multiple FastAPI apps at different paths.
 """
 
+import asyncio
+import atexit
+import contextlib
+import os
+import shutil
+import tempfile
 import time
+from types import SimpleNamespace
 
+import orjson
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response
 from pydantic import BaseModel
 
+# A large (8 MiB) download, written once at import time into a private temp
+# directory. FileResponse sends it with the ASGI http.response.pathsend
+# extension, so the server streams it from disk instead of Python reading it.
+# Small pages are cheaper as prebuilt bytes and don't go through a file.
+DOWNLOAD_DIR = tempfile.mkdtemp(prefix="tsuno-example-")
+atexit.register(shutil.rmtree, DOWNLOAD_DIR, ignore_errors=True)
+DOWNLOAD_PATH = os.path.join(DOWNLOAD_DIR, "download.bin")
+with open(DOWNLOAD_PATH, "wb") as f:
+    f.write(bytes(range(256)) * (32 * 1024))
+
+
+# Cached wall clock in integer milliseconds, refreshed every 100 ms by a single
+# background task so handlers read clock.ms instead of calling time.time().
+# main_app's lifespan runs it (root_app's in main_with_submount()).
+clock = SimpleNamespace(ms=time.time_ns() // 1_000_000)
+
+
+@contextlib.asynccontextmanager
+async def clock_lifespan(app):
+    """Refresh clock.ms while the app is running."""
+
+    async def tick():
+        while True:
+            clock.ms = time.time_ns() // 1_000_000
+            await asyncio.sleep(0.1)
+
+    task = asyncio.create_task(tick())
+    try:
+        yield
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+
+
+# Constant payloads are serialized once at import time with orjson. A fresh
+# Response is built per call because FastAPI assigns BackgroundTasks onto the
+# response an endpoint returns, so a shared instance would leak tasks across
+# requests.
+def json_response(body: bytes) -> Response:
+    """Wrap a prebuilt JSON payload in a fresh Response."""
+    return Response(content=body, media_type="application/json")
+
 
 # Models for API
 class User(BaseModel):
@@ -31,12 +82,10 @@ class EchoRequest(BaseModel):
 
 
 # Create main application
-main_app = FastAPI(title="Main Application")
+main_app = FastAPI(title="Main Application", default_response_class=ORJSONResponse, lifespan=clock_lifespan)
 
 
-@main_app.get("/", response_class=HTMLResponse)
-async def main_index():
-    return """
+MAIN_INDEX_HTML = """
     <html>
     <body>
         <h1>Main Application</h1>
@@ -49,76 +98,94 @@ async def main_index():
             <li><a href="/admin/docs">Admin API Docs</a></li>
             <li><a href="/metrics">Metrics Service</a></li>
             <li><a href="/metrics/docs">Metrics API Docs</a></li>
+            <li><a href="/download">Large Download (8 MiB)</a></li>
         </ul>
     </body>
     </html>
-    """
+    """.encode()
+
+
+@main_app.get("/", response_class=HTMLResponse)
+async def main_index():
+    return HTMLResponse(MAIN_INDEX_HTML)
+
+
+@main_app.get("/download")
+async def main_download():
+    return FileResponse(DOWNLOAD_PATH, media_type="application/octet-stream", filename="download.bin")
 
 
 @main_app.get("/health")
 async def main_health():
-    return {"status": "healthy", "service": "main", "timestamp": time.time()}
+    return {"status": "healthy", "service": "main", "timestamp": clock.ms}
+
+
+_ABOUT_JSON = orjson.dumps({"service": "Main Application", "version": "1.0.0"})
 
 
 @main_app.get("/about")
 async def main_about():
-    return {"service": "Main Application", "version": "1.0.0"}
+    return json_response(_ABOUT_JSON)
 
 
 # Create API application
-api_app = FastAPI(title="API Service", version="2.0.0")
+api_app = FastAPI(title="API Service", version="2.0.0", default_response_class=ORJSONResponse)
 
 
-@api_app.get("/")
-async def api_index():
-    return {
+USERS = [
+    User(id=1, name="Alice", email="alice@example.com"),
+    User(id=2, name="Bob", email="bob@example.com"),
+    User(id=3, name="Charlie", email="charlie@example.com"),
+]
+POSTS = [
+    Post(id=1, title="First Post", content="This is the first post", author_id=1),
+    Post(id=2, title="Second Post", content="This is the second post", author_id=2),
+]
+
+_API_INDEX_JSON = orjson.dumps(
+    {
         "service": "API",
         "version": "2.0.0",
         "endpoints": ["/users", "/posts", "/echo"],
     }
+)
+_USERS_JSON = orjson.dumps([user.model_dump() for user in USERS])
+_USER_JSON = {user.id: orjson.dumps(user.model_dump()) for user in USERS}
+_POSTS_JSON = orjson.dumps([post.model_dump() for post in POSTS])
+
+
+@api_app.get("/")
+async def api_index():
+    return json_response(_API_INDEX_JSON)
 
 
-@api_app.get("/users", response_model=list[User])
+@api_app.get("/users")
 async def api_users():
-    return [
-        User(id=1, name="Alice", email="alice@example.com"),
-        User(id=2, name="Bob", email="bob@example.com"),
-        User(id=3, name="Charlie", email="charlie@example.com"),
-    ]
+    return json_response(_USERS_JSON)
 
 
-@api_app.get("/users/{user_id}", response_model=User)
+@api_app.get("/users/{user_id}")
 async def api_user(user_id: int):
-    users = {
-        1: User(id=1, name="Alice", email="alice@example.com"),
-        2: User(id=2, name="Bob", email="bob@example.com"),
-        3: User(id=3, name="Charlie", email="charlie@example.com"),
-    }
-    if user_id not in users:
+    if user_id not in _USER_JSON:
         raise HTTPException(status_code=404, detail="User not found")
-    return users[user_id]
+    return json_response(_USER_JSON[user_id])
 
 
-@api_app.get("/posts", response_model=list[Post])
+@api_app.get("/posts")
 async def api_posts():
-    return [
-        Post(id=1, title="First Post", content="This is the first post", author_id=1),
-        Post(id=2, title="Second Post", content="This is the second post", author_id=2),
-    ]
+    return json_response(_POSTS_JSON)
 
 
 @api_app.post("/echo")
 async def api_echo(request: EchoRequest):
-    return {"echo": request.message, "timestamp": time.time()}
+    return {"echo": request.message, "timestamp": clock.ms}
 
 
 # Create admin application
-admin_app = FastAPI(title="Admin Panel")
+admin_app = FastAPI(title="Admin Panel", default_response_class=ORJSONResponse)
 
 
-@admin_app.get("/", response_class=HTMLResponse)
-async def admin_index():
-    return """
+ADMIN_INDEX_HTML = """
     <html>
     <body>
         <h1>Admin Panel</h1>
@@ -131,32 +198,32 @@ async def admin_index():
         </ul>
     </body>
     </html>
-    """
+    """.encode()
 
 
-@admin_app.get("/users")
-async def admin_users():
-    return {
+@admin_app.get("/", response_class=HTMLResponse)
+async def admin_index():
+    return HTMLResponse(ADMIN_INDEX_HTML)
+
+
+_ADMIN_USERS_JSON = orjson.dumps(
+    {
         "total_users": 3,
         "active_users": 2,
         "suspended_users": 1,
         "last_registration": "2025-09-20T10:30:00Z",
     }
-
-
-@admin_app.get("/settings")
-async def admin_settings():
-    return {
+)
+_ADMIN_SETTINGS_JSON = orjson.dumps(
+    {
         "maintenance_mode": False,
         "max_upload_size": "10MB",
         "session_timeout": 3600,
         "debug_mode": False,
     }
-
-
-@admin_app.get("/logs")
-async def admin_logs():
-    return {
+)
+_ADMIN_LOGS_JSON = orjson.dumps(
+    {
         "logs": [
             {
                 "timestamp": "2025-09-20T10:00:00Z",
@@ -180,34 +247,58 @@ async def admin_logs():
             },
         ]
     }
-
-
-@admin_app.get("/stats")
-async def admin_stats():
-    return {
+)
+_ADMIN_STATS_JSON = orjson.dumps(
+    {
         "cpu_usage": "25%",
         "memory_usage": "45%",
         "disk_usage": "60%",
         "active_connections": 42,
         "requests_per_second": 150,
     }
+)
+
+
+@admin_app.get("/users")
+async def admin_users():
+    return json_response(_ADMIN_USERS_JSON)
+
+
+@admin_app.get("/settings")
+async def admin_settings():
+    return json_response(_ADMIN_SETTINGS_JSON)
+
+
+@admin_app.get("/logs")
+async def admin_logs():
+    return json_response(_ADMIN_LOGS_JSON)
+
+
+@admin_app.get("/stats")
+async def admin_stats():
+    return json_response(_ADMIN_STATS_JSON)
 
 
 # Create metrics application
-metrics_app = FastAPI(title="Metrics Service")
+metrics_app = FastAPI(title="Metrics Service", default_response_class=ORJSONResponse)
 
 
-@metrics_app.get("/")
-async def metrics_index():
-    return {
+_METRICS_INDEX_JSON = orjson.dumps(
+    {
         "service": "Metrics",
         "available_metrics": ["/cpu", "/memory", "/requests", "/latency"],
     }
+)
+
+
+@metrics_app.get("/")
+async def metrics_index():
+    return json_response(_METRICS_INDEX_JSON)
 
 
 @metrics_app.get("/cpu")
 async def metrics_cpu():
-    return {"metric": "cpu", "value": 25.5, "unit": "percent", "timestamp": time.time()}
+    return {"metric": "cpu", "value": 25.5, "unit": "percent", "timestamp": clock.ms}
 
 
 @metrics_app.get("/memory")
@@ -217,7 +308,7 @@ async def metrics_memory():
         "used": 1024,
         "total": 2048,
         "unit": "MB",
-        "timestamp": time.time(),
+        "timestamp": clock.ms,
     }
 
 
@@ -229,7 +320,7 @@ async def metrics_requests():
         "success": 999500,
         "errors": 500,
         "rate": 150,
-        "timestamp": time.time(),
+        "timestamp": clock.ms,
     }
 
 
@@ -241,7 +332,7 @@ async def metrics_latency():
         "p95": 25,
         "p99": 50,
         "unit": "ms",
-        "timestamp": time.time(),
+        "timestamp": clock.ms,
     }
 
 
@@ -276,7 +367,9 @@ def main_with_submount():
     from tsuno import serve
 
     # Create a main app and mount sub-apps using FastAPI's mount
-    root_app = FastAPI(title="Root Application with Sub-Apps")
+    root_app = FastAPI(
+        title="Root Application with Sub-Apps", default_response_class=ORJSONResponse, lifespan=clock_lifespan
+    )
 
     # Mount sub-applications
     root_app.mount("/api", api_app)
@@ -296,12 +389,13 @@ if __name__ == "__main__":
     # Check if FastAPI is installed
     try:
         import fastapi  # noqa: F401
+        import orjson  # noqa: F401
         import pydantic  # noqa: F401
     except ImportError:
-        print("FastAPI or Pydantic is not installed. Please install them with:")
-        print("  pip install fastapi pydantic")
+        print("FastAPI, Pydantic or orjson is not installed. Please install them with:")
+        print("  pip install fastapi pydantic orjson")
         print("or")
-        print("  uv pip install fastapi pydantic")
+        print("  uv pip install fastapi pydantic orjson")
         exit(1)
 
     # Use the dictionary syntax (simpler)
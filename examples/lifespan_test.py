@@ -8,7 +8,7 @@ Demonstrates proper startup/shutdown lifecycle management.
 import asyncio
 import sys
 
-from tsuno import serve
+from tsuno import register_headers, serve
 
 
 # Simulated database connection
@@ -32,6 +32,25 @@ class Database:
 # Global database instance
 db = Database()
 
+# Response messages are built once at import time and reused for every request.
+# The headers are registered with tsuno, so they are not decoded per response.
+_H_PLAIN = register_headers([(b"content-type", b"text/plain")])
+_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers_id": _H_PLAIN,
+}
+_BODY_OK = {
+    "type": "http.response.body",
+    "body": b"Hello! Database is connected and ready.\n",
+    "more_body": False,
+}
+_BODY_WARN = {
+    "type": "http.response.body",
+    "body": b"Warning: Database is not connected!\n",
+    "more_body": False,
+}
+
 
 async def lifespan_app(scope, receive, send):
     """ASGI app with lifespan support."""
@@ -73,35 +92,15 @@ async def lifespan_app(scope, receive, send):
 
     elif scope["type"] == "http":
         # Handle HTTP requests
-        # Receive request body (not used in this example)
-        while True:
+        # Drain the request body (not used in this example); stops on the last
+        # chunk or on http.disconnect, which carries no more_body
+        message = await receive()
+        while message.get("more_body"):
             message = await receive()
-            if message["type"] == "http.request":
-                if not message.get("more_body", False):
-                    break
-
-        # Send response
-        await send(
-            {
-                "type": "http.response.start",
-                "status": 200,
-                "headers": [(b"content-type", b"text/plain")],
-            }
-        )
-
-        # Response depends on DB connection status
-        if db.connected:
-            body = b"Hello! Database is connected and ready.\n"
-        else:
-            body = b"Warning: Database is not connected!\n"
-
-        await send(
-            {
-                "type": "http.response.body",
-                "body": body,
-                "more_body": False,
-            }
-        )
+
+        # Send response (body depends on DB connection status)
+        await send(_START)
+        await send(_BODY_OK if db.connected else _BODY_WARN)
 
 
 def main():
@@ -14,10 +14,27 @@ Architecture:
 - Single Tsuno server handles both protocols transparently
 """
 
-from fastapi import FastAPI
-from flask import Flask, jsonify
+import atexit
+import itertools
+import os
+import shutil
+import tempfile
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
+from flask import Blueprint, Flask, Response, jsonify, send_file
 from pydantic import BaseModel
 
+# A large (8 MiB) download, written once at import time into a private temp
+# directory. Flask's send_file() returns it through wsgi.file_wrapper, so the
+# server streams it from disk instead of Python reading it. Small pages are
+# cheaper as prebuilt bytes and don't go through a file.
+DOWNLOAD_DIR = tempfile.mkdtemp(prefix="tsuno-example-")
+atexit.register(shutil.rmtree, DOWNLOAD_DIR, ignore_errors=True)
+DOWNLOAD_PATH = os.path.join(DOWNLOAD_DIR, "download.bin")
+with open(DOWNLOAD_PATH, "wb") as f:
+    f.write(bytes(range(256)) * (32 * 1024))
+
 # ============================================================================
 # Flask Application (WSGI)
 # ============================================================================
@@ -25,10 +42,7 @@ from pydantic import BaseModel
 flask_app = Flask(__name__)
 
 
-@flask_app.route("/")
-def flask_index():
-    """Main landing page served by Flask."""
-    return """
+INDEX_HTML = """
     <html>
     <head>
         <title>Mixed WSGI/ASGI Application</title>
@@ -52,6 +66,7 @@ def flask_index():
                 <li><a href="/">Main Page</a> - This page</li>
                 <li><a href="/flask/hello">Hello Endpoint</a> - Simple Flask response</li>
                 <li><a href="/admin">Admin Panel</a> - Flask admin interface</li>
+                <li><a href="/download">Large Download</a> - 8 MiB file sent with send_file</li>
             </ul>
         </div>
 
@@ -82,7 +97,19 @@ curl -X POST http://localhost:8000/api/items \\
         </div>
     </body>
     </html>
-    """
+    """.encode()
+
+
+@flask_app.route("/")
+def flask_index():
+    """Main landing page served by Flask."""
+    return Response(INDEX_HTML, mimetype="text/html")
+
+
+@flask_app.route("/download")
+def flask_download():
+    """Large file download, streamed by the server through wsgi.file_wrapper."""
+    return send_file(DOWNLOAD_PATH, mimetype="application/octet-stream", as_attachment=True, conditional=True)
 
 
 @flask_app.route("/flask/hello")
@@ -98,20 +125,19 @@ def flask_hello():
 
 
 # ============================================================================
-# Flask Admin Application (WSGI)
+# Flask Admin Blueprint (WSGI)
 # ============================================================================
 
-admin_app = Flask(__name__)
+# Admin routes live on the main Flask app as a blueprint, so a single WSGI
+# app handles both / and /admin and each request is routed only once
+admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
 
 
-@admin_app.route("/")
-def admin_index():
-    """Admin panel main page."""
-    return """
+ADMIN_INDEX_HTML = """
     <html>
     <body>
         <h1>Admin Panel</h1>
-        <p>This is a separate Flask application mounted at /admin</p>
+        <p>This is a Flask blueprint registered at /admin</p>
         <ul>
             <li><a href="/admin/users">User Management</a></li>
             <li><a href="/admin/settings">Settings</a></li>
@@ -119,10 +145,16 @@ def admin_index():
         </ul>
     </body>
     </html>
-    """
+    """.encode()
 
 
-@admin_app.route("/users")
+@admin_bp.route("/", strict_slashes=False)
+def admin_index():
+    """Admin panel main page."""
+    return Response(ADMIN_INDEX_HTML, mimetype="text/html")
+
+
+@admin_bp.route("/users")
 def admin_users():
     """User management endpoint."""
     return jsonify(
@@ -136,7 +168,7 @@ def admin_users():
     )
 
 
-@admin_app.route("/settings")
+@admin_bp.route("/settings")
 def admin_settings():
     """Settings endpoint."""
     return jsonify(
@@ -149,6 +181,9 @@ def admin_settings():
     )
 
 
+flask_app.register_blueprint(admin_bp)
+
+
 # ============================================================================
 # FastAPI Application (ASGI)
 # ============================================================================
@@ -157,6 +192,7 @@ fastapi_app = FastAPI(
     title="Mixed App API",
     description="FastAPI running alongside Flask on the same Tsuno server",
     version="1.0.0",
+    default_response_class=ORJSONResponse,  # Serialize responses with orjson
 )
 
 
@@ -174,11 +210,13 @@ class ItemResponse(BaseModel):
     description: str | None = None
 
 
-# In-memory storage for demo
-items_db = [
-    {"id": 1, "name": "Widget", "price": 9.99, "description": "A useful widget"},
-    {"id": 2, "name": "Gadget", "price": 19.99, "description": "An amazing gadget"},
-]
+# In-memory storage for demo, keyed by id (dicts keep insertion order)
+items_db = {
+    1: {"id": 1, "name": "Widget", "price": 9.99, "description": "A useful widget"},
+    2: {"id": 2, "name": "Gadget", "price": 19.99, "description": "An amazing gadget"},
+}
+# Ids for new items; next() on a count hands out each id once
+item_ids = itertools.count(max(items_db) + 1)
 
 
 @fastapi_app.get("/")
@@ -210,28 +248,29 @@ async def api_status():
 @fastapi_app.get("/items", response_model=list[ItemResponse])
 async def get_items():
     """Get all items."""
-    return items_db
+    return list(items_db.values())
 
 
 @fastapi_app.get("/items/{item_id}", response_model=ItemResponse)
 async def get_item(item_id: int):
     """Get a specific item by ID."""
-    for item in items_db:
-        if item["id"] == item_id:
-            return item
-    return {"error": "Item not found"}
+    item = items_db.get(item_id)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    return item
 
 
 @fastapi_app.post("/items", response_model=ItemResponse)
 async def create_item(item: Item):
     """Create a new item."""
+    new_id = next(item_ids)
     new_item = {
-        "id": len(items_db) + 1,
+        "id": new_id,
         "name": item.name,
         "price": item.price,
         "description": item.description,
     }
-    items_db.append(new_item)
+    items_db[new_id] = new_item
     return new_item
 
 
@@ -249,7 +288,7 @@ def main():
     print("=" * 70)
     print("\nMounting applications:")
     print("  /         → Flask (WSGI) - Main application")
-    print("  /admin    → Flask (WSGI) - Admin panel")
+    print("  /admin    → Flask (WSGI) - Admin panel blueprint")
     print("  /api      → FastAPI (ASGI) - REST API")
     print("\nServer starting on http://localhost:8000")
     print("\nKey features demonstrated:")
@@ -260,11 +299,13 @@ def main():
     print("=" * 70)
     print()
 
-    # Mount both WSGI (Flask) and ASGI (FastAPI) apps on the same server
+    # Mount both WSGI (Flask) and ASGI (FastAPI) apps on the same server.
+    # Each app's protocol is detected once at startup and WSGI runs natively on
+    # tsuno's blocking threads, so wrapping Flask in an ASGI bridge (e.g.
+    # asgiref's WsgiToAsgi) would only add event loop <-> thread hops.
     serve(
         {
-            "/": flask_app,  # WSGI
-            "/admin": admin_app,  # WSGI
+            "/": flask_app,  # WSGI (includes the /admin blueprint)
             "/api": fastapi_app,  # ASGI
         },
         address="0.0.0.0:8000",
@@ -278,12 +319,13 @@ if __name__ == "__main__":
     try:
         import fastapi  # noqa: F401
         import flask  # noqa: F401
+        import orjson  # noqa: F401
         import pydantic  # noqa: F401
     except ImportError:
         print("Required dependencies not installed. Please install with:")
-        print("  pip install flask fastapi pydantic")
+        print("  pip install flask fastapi pydantic orjson")
         print("or")
-        print("  uv pip install flask fastapi pydantic")
+        print("  uv pip install flask fastapi pydantic orjson")
         exit(1)
 
     main()
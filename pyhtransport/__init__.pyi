@@ -1,5 +1,6 @@
 """Type stubs for pyhtransport module."""
 
+import os
 from typing import Callable, Optional
 
 class DedicatedThreadServer:
@@ -123,6 +124,27 @@ class ResponseSender:
         """
         ...
 
+    def send_file(self, file: str | os.PathLike[str] | int) -> None:
+        """
+        Send the rest of the response body from a file (streaming mode).
+
+        Used for the ASGI http.response.pathsend extension and for WSGI
+        responses returned through wsgi.file_wrapper. Only the file is opened
+        here; its contents are streamed by the server in 64 KiB reads off the
+        calling thread. Must be called after send_start().
+
+        Args:
+            file: Path of the file to send, or an open file descriptor
+                (Unix only). The sender takes ownership of the descriptor and
+                closes it when done.
+
+        Raises:
+            RuntimeError: If response not started (call send_start() first)
+            ValueError: If the file descriptor is invalid
+            OSError: If the file cannot be opened
+        """
+        ...
+
     def send_trailers(self, trailers: list[tuple[str, str]]) -> None:
         """
         Send HTTP trailers (streaming mode).
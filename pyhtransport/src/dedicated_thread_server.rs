@@ -10,7 +10,9 @@ use hyper_util::rt::TokioIo;
 use hyper_util::server::conn::auto::Builder;
 use pyo3::prelude::*;
 use std::convert::Infallible;
+use std::fs::File;
 use std::future::Future;
+use std::io::Read;
 #[cfg(unix)]
 use std::os::unix::io::{FromRawFd, RawFd};
 use std::pin::Pin;
@@ -556,6 +558,75 @@ impl DedicatedThreadServer {
     }
 }
 
+// Read size for file bodies (ResponseChunk::File)
+const FILE_CHUNK_SIZE: usize = 64 * 1024;
+
+// Convert the response chunks that follow Start into body frames.
+// File bodies are read FILE_CHUNK_SIZE bytes at a time on tokio's blocking
+// pool, one read per frame polled by hyper, so memory stays bounded by the
+// client's pace and the Python threads never wait on disk I/O.
+fn response_frames(
+    chunks: UnboundedReceiverStream<ResponseChunk>,
+) -> impl futures::Stream<Item = Result<Frame<Bytes>, Infallible>> + Send + Sync + 'static {
+    futures::stream::unfold(
+        (chunks, None::<Arc<File>>),
+        |(mut chunks, mut file)| async move {
+            loop {
+                if let Some(f) = file.take() {
+                    let read = tokio::task::spawn_blocking(move || {
+                        let mut buf = vec![0u8; FILE_CHUNK_SIZE];
+                        let result = (&*f).read(&mut buf).map(|n| {
+                            buf.truncate(n);
+                            buf
+                        });
+                        (f, result)
+                    })
+                    .await;
+                    match read {
+                        Ok((f, Ok(buf))) if !buf.is_empty() => {
+                            let frame = Frame::data(Bytes::from(buf));
+                            return Some((Ok::<_, Infallible>(frame), (chunks, Some(f))));
+                        }
+                        // End of file: continue with the remaining chunks
+                        Ok((_, Ok(_))) => {}
+                        Ok((_, Err(e))) => {
+                            error!("Failed to read file body: {}", e);
+                            return None;
+                        }
+                        Err(e) => {
+                            error!("File read task failed: {}", e);
+                            return None;
+                        }
+                    }
+                }
+
+                let frame = match chunks.next().await? {
+                    ResponseChunk::Body { data, .. } => Frame::data(Bytes::from(data)),
+                    ResponseChunk::File { file: f } => {
+                        file = Some(f);
+                        continue;
+                    }
+                    ResponseChunk::Trailers { trailers } => {
+                        // Convert trailers to HeaderMap
+                        let mut trailer_map = HeaderMap::new();
+                        for (key, value) in trailers {
+                            if let Ok(name) = HeaderName::from_bytes(key.as_bytes()) {
+                                if let Ok(val) = HeaderValue::from_str(&value) {
+                                    trailer_map.insert(name, val);
+                                }
+                            }
+                        }
+                        Frame::trailers(trailer_map)
+                    }
+                    // Unexpected chunk type, ignore
+                    ResponseChunk::Start { .. } => continue,
+                };
+                return Some((Ok::<_, Infallible>(frame), (chunks, file)));
+            }
+        },
+    )
+}
+
 // Worker function for blocking threads with persistent GIL
 fn blocking_thread_worker(
     thread_id: usize,
@@ -796,24 +867,7 @@ impl Service<Request<Incoming>> for DedicatedThreadService {
             }
 
             // Create streaming body from remaining chunks
-            let body_stream = chunk_stream.map(|chunk| match chunk {
-                ResponseChunk::Body { data, .. } => Ok(Frame::data(Bytes::from(data))),
-                ResponseChunk::Trailers { trailers } => {
-                    // Convert trailers to HeaderMap
-                    let mut trailer_map = HeaderMap::new();
-                    for (key, value) in trailers {
-                        if let Ok(name) = HeaderName::from_bytes(key.as_bytes()) {
-                            if let Ok(val) = HeaderValue::from_str(&value) {
-                                trailer_map.insert(name, val);
-                            }
-                        }
-                    }
-                    Ok(Frame::trailers(trailer_map))
-                }
-                _ => Ok(Frame::data(Bytes::new())), // Unexpected chunk type, ignore
-            });
-
-            let streaming_body = StreamBody::new(body_stream).boxed();
+            let streaming_body = StreamBody::new(response_frames(chunk_stream)).boxed();
 
             Ok(resp_builder.body(streaming_body).unwrap())
         })
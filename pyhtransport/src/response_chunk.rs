@@ -1,3 +1,6 @@
+use std::fs::File;
+use std::sync::Arc;
+
 /// Response chunk types for streaming support
 #[derive(Debug, Clone)]
 pub enum ResponseChunk {
@@ -8,6 +11,9 @@ pub enum ResponseChunk {
     },
     /// Send a body chunk
     Body { data: Vec<u8>, more_body: bool },
+    /// Stream the rest of the body from a file (read in bounded chunks
+    /// by the connection task as the client consumes it)
+    File { file: Arc<File> },
     /// Send trailers (HTTP/2 or chunked HTTP/1.1)
     Trailers { trailers: Vec<(String, String)> },
 }
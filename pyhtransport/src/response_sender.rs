@@ -1,8 +1,40 @@
 use pyo3::prelude::*;
+use std::fs::File;
+use std::path::PathBuf;
+use std::sync::Arc;
 use tokio::sync::mpsc;
 
 use crate::response_chunk::ResponseChunk;
 
+/// File accepted by `ResponseSender.send_file`: a path, or an open file
+/// descriptor whose ownership passes to the sender
+#[derive(FromPyObject)]
+pub enum FileSource {
+    Fd(i32),
+    Path(PathBuf),
+}
+
+/// Take ownership of an open file descriptor
+#[cfg(unix)]
+fn file_from_fd(fd: i32) -> PyResult<File> {
+    use std::os::unix::io::FromRawFd;
+
+    if fd < 0 {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "Invalid file descriptor",
+        ));
+    }
+    // SAFETY: the caller hands over ownership of the descriptor
+    Ok(unsafe { File::from_raw_fd(fd) })
+}
+
+#[cfg(not(unix))]
+fn file_from_fd(_fd: i32) -> PyResult<File> {
+    Err(pyo3::exceptions::PyValueError::new_err(
+        "File descriptors are only supported on Unix",
+    ))
+}
+
 /// ResponseSender for streaming HTTP responses
 #[pyclass]
 pub struct ResponseSender {
@@ -87,6 +119,30 @@ impl ResponseSender {
         Ok(())
     }
 
+    /// Streaming method: Send the rest of the body from a file
+    /// (ASGI http.response.pathsend, WSGI wsgi.file_wrapper).
+    /// The file is only opened here; its contents are streamed in bounded
+    /// chunks by the connection task, off the calling thread.
+    pub fn send_file(&mut self, py: Python<'_>, file: FileSource) -> PyResult<()> {
+        if !self.started {
+            return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                "Response not started. Call send_start() first",
+            ));
+        }
+
+        let file = match file {
+            FileSource::Path(path) => py.detach(|| File::open(path))?,
+            FileSource::Fd(fd) => file_from_fd(fd)?,
+        };
+
+        self.streaming_tx
+            .send(ResponseChunk::File {
+                file: Arc::new(file),
+            })
+            .map_err(|_| pyo3::exceptions::PyRuntimeError::new_err("Failed to send file body"))?;
+        Ok(())
+    }
+
     /// Streaming method: Send trailers (HTTP/2 or chunked HTTP/1.1)
     pub fn send_trailers(&mut self, trailers: Vec<(String, String)>) -> PyResult<()> {
         self.streaming_tx
@@ -72,4 +72,42 @@ if [ -f examples/wsgi_flask_app.py ]; then
 fi
 echo ""
 
+# Test 7: File responses (ASGI http.response.pathsend, WSGI wsgi.file_wrapper)
+echo "Test 7: File responses"
+head -c 1048576 /dev/urandom > /tmp/tsuno_test_file.bin
+cat > /tmp/tsuno_file_apps.py <<'EOF'
+from tsuno import serve
+
+FILE = "/tmp/tsuno_test_file.bin"
+
+
+async def asgi_app(scope, receive, send):
+    path = FILE if scope["path"].endswith("/file") else FILE + ".missing"
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/octet-stream")]})
+    await send({"type": "http.response.pathsend", "path": path})
+
+
+def wsgi_app(environ, start_response):
+    path = FILE if environ["PATH_INFO"].endswith("/file") else FILE + ".missing"
+    f = open(path, "rb")
+    start_response("200 OK", [("Content-Type", "application/octet-stream")])
+    return environ["wsgi.file_wrapper"](f)
+
+
+serve({"/asgi": {"http": asgi_app}, "/wsgi": wsgi_app}, address="0.0.0.0:8002", workers=1, access_log=False)
+EOF
+python /tmp/tsuno_file_apps.py &
+PID=$!
+sleep 5
+for APP in asgi wsgi; do
+    curl -s -o /tmp/tsuno_download.bin http://localhost:8002/$APP/file
+    cmp -s /tmp/tsuno_download.bin /tmp/tsuno_test_file.bin && echo "✅ $APP file response works" || (kill $PID; exit 1)
+    STATUS=$(curl -s -o /dev/null -w "%{http_code}" http://localhost:8002/$APP/missing)
+    [ "$STATUS" = "500" ] && echo "✅ $APP missing file returns 500" || (kill $PID; exit 1)
+done
+kill $PID 2>/dev/null || true
+wait $PID 2>/dev/null || true
+rm -f /tmp/tsuno_test_file.bin /tmp/tsuno_download.bin /tmp/tsuno_file_apps.py
+echo ""
+
 echo "All basic tests completed!"
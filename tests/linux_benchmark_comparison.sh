@@ -25,7 +25,7 @@ async def app(scope, receive, send):
     await send({
         "type": "http.response.start",
         "status": 200,
-        "headers": [(b"content-type", b"text/plain")],
+        "headers": [(b"content-type", b"text/plain"), (b"content-length", b"13")],
     })
 
     await send({
@@ -8,6 +8,8 @@ from .asgi_adapter import ASGIAdapter
 from .asgi_event_loop_worker import ASGIEventLoopWorker
 from .constants import HttpVersion
 from .dispatcher import Dispatcher
+from .headers import register_headers
+from .static_response import StaticResponse, static_response
 from .unified_server import serve, serve_fd, serve_uds
 from .wsgi_adapter import WSGIAdapter
 
@@ -24,6 +26,11 @@ __all__ = [
     "ASGIEventLoopWorker",
     # Dispatcher
     "Dispatcher",
+    # Static responses
+    "static_response",
+    "StaticResponse",
+    # Registered response headers
+    "register_headers",
     # Constants
     "HttpVersion",
 ]
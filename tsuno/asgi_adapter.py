@@ -22,12 +22,17 @@ class ASGIAdapter:
     in a dedicated event loop thread.
     """
 
-    def __init__(self, asgi_app: Callable, root_path: str = "", use_uvloop: bool = True):
+    def __init__(
+        self,
+        asgi_app: Callable | dict[str, Callable],
+        root_path: str = "",
+        use_uvloop: bool = True,
+    ):
         """
         Initialize the ASGI adapter.
 
         Args:
-            asgi_app: An ASGI application callable
+            asgi_app: An ASGI application callable, or a dictionary mapping scope types to handlers
             root_path: ASGI root_path for submounted applications
             use_uvloop: Enable uvloop for application-level I/O acceleration
         """
@@ -6,12 +6,15 @@ a dedicated AsyncIO event loop in a separate thread.
 """
 
 import asyncio
+import os
 import sys
 import threading
 import time
 from typing import Any, Callable
 from urllib.parse import unquote, urlsplit
 
+from .headers import get_registered_headers
+
 
 class ASGIEventLoopWorker:
     """
@@ -26,16 +29,33 @@ class ASGIEventLoopWorker:
     - Requests are scheduled as tasks without blocking
     """
 
-    def __init__(self, asgi_app: Callable, root_path: str = "", use_uvloop: bool = True):
+    def __init__(
+        self,
+        asgi_app: Callable | dict[str, Callable],
+        root_path: str = "",
+        use_uvloop: bool = True,
+    ):
         """
         Initialize the event loop worker.
 
         Args:
-            asgi_app: ASGI application callable
+            asgi_app: ASGI application callable, or a dictionary mapping scope types
+                      to handlers (e.g. {"http": http_handler, "lifespan": lifespan_handler})
             root_path: ASGI root_path for submounted applications
             use_uvloop: Enable uvloop for application-level I/O acceleration
         """
         self.asgi_app = asgi_app
+
+        # Resolve per-scope-type handlers once so requests skip the scope["type"] check
+        if isinstance(asgi_app, dict):
+            if "http" not in asgi_app:
+                raise ValueError("ASGI handler dictionary must contain an 'http' handler")
+            self.http_app = asgi_app["http"]
+            self.lifespan_app = asgi_app.get("lifespan")  # None = no lifespan protocol
+        else:
+            self.http_app = asgi_app
+            self.lifespan_app = asgi_app
+
         self.root_path = root_path
         self.use_uvloop = use_uvloop
         self.loop: asyncio.AbstractEventLoop | None = None
@@ -56,12 +76,15 @@ class ASGIEventLoopWorker:
         """Start AsyncIO event loop in dedicated thread."""
 
         def run_loop():
-            # Install uvloop if requested
+            # Create event loop (uvloop or standard asyncio). The uvloop loop is
+            # created directly rather than via uvloop.install(), which is
+            # deprecated and replaces the process-wide event loop policy.
+            loop = None
             if self.use_uvloop:
                 try:
                     import uvloop
 
-                    uvloop.install()
+                    loop = uvloop.new_event_loop()
                 except ImportError:
                     import warnings
 
@@ -73,8 +96,7 @@ class ASGIEventLoopWorker:
                         stacklevel=2,
                     )
 
-            # Create event loop (uvloop or standard asyncio)
-            self.loop = asyncio.new_event_loop()
+            self.loop = loop or asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
 
             # Run event loop forever (non-blocking architecture)
@@ -209,10 +231,33 @@ class ASGIEventLoopWorker:
             "server": server_address,
             "client": real_client_address,
             "state": {},  # Connection state
+            # Server extensions (http.response.full is tsuno-specific)
+            "extensions": {"http.response.full": {}, "http.response.pathsend": {}},
         }
 
         return scope
 
+    @staticmethod
+    def _response_headers(message: dict[str, Any]) -> list[tuple[str, str]]:
+        """
+        Convert response headers from an ASGI message to string tuples.
+
+        Messages may carry a "headers_id" from register_headers() (tsuno
+        extension); its pre-decoded headers are used as-is, followed by any
+        per-response "headers".
+        """
+        # Convert headers from ASGI format (bytes) to string tuples
+        headers = [
+            (header_name.decode("latin-1"), header_value.decode("latin-1"))
+            for header_name, header_value in message.get("headers", ())
+        ]
+
+        headers_id = message.get("headers_id")
+        if headers_id is not None:
+            registered = get_registered_headers(headers_id)
+            return registered + headers if headers else registered
+        return headers
+
     async def _handle_request_async(
         self,
         sender,
@@ -233,6 +278,7 @@ class ASGIEventLoopWorker:
 
         # Track response state
         response_started = False
+        start_sent = False
         response_sent = False
         response_status = 500
         response_headers = []
@@ -285,7 +331,7 @@ class ASGIEventLoopWorker:
 
         # Create send callable
         async def send(message: dict[str, Any]):
-            nonlocal response_started, response_sent, response_status, response_headers, response_body
+            nonlocal response_started, start_sent, response_sent, response_status, response_headers, response_body
 
             match message["type"]:
                 case "http.response.start":
@@ -295,18 +341,9 @@ class ASGIEventLoopWorker:
                     response_started = True
                     response_status = message["status"]
 
-                    # Convert headers from ASGI format (bytes) to string tuples
-                    for header_name, header_value in message.get("headers", []):
-                        response_headers.append(
-                            (
-                                header_name.decode("latin-1"),
-                                header_value.decode("latin-1"),
-                            )
-                        )
-
-                    # If sender supports streaming, send start immediately
-                    if hasattr(sender, "is_streaming") and sender.is_streaming():
-                        sender.send_start(response_status, response_headers)
+                    # Streaming senders get the start with the first body message,
+                    # so a pathsend file is opened before any headers go out
+                    response_headers = self._response_headers(message)
 
                 case "http.response.body":
                     if not response_started:
@@ -317,6 +354,9 @@ class ASGIEventLoopWorker:
 
                     # If sender supports streaming, send chunk immediately
                     if hasattr(sender, "is_streaming") and sender.is_streaming():
+                        if not start_sent:
+                            start_sent = True
+                            sender.send_start(response_status, response_headers)
                         if body_chunk or not more_body:  # Send if has data or last chunk
                             sender.send_chunk(body_chunk, more_body)
                         response_sent = not more_body
@@ -338,13 +378,53 @@ class ASGIEventLoopWorker:
                                     None,
                                 )
 
+                case "http.response.pathsend":
+                    # ASGI pathsend extension: the response body is the content of a file
+                    if not response_started:
+                        raise RuntimeError("Response not started")
+
+                    if hasattr(sender, "is_streaming") and sender.is_streaming():
+                        # A missing or unreadable file fails here, while a 500 can still be sent
+                        fd = os.open(message["path"], os.O_RDONLY)
+                        try:
+                            if not start_sent:
+                                start_sent = True
+                                sender.send_start(response_status, response_headers)
+                        except BaseException:
+                            os.close(fd)
+                            raise
+                        # The sender takes ownership of fd
+                        sender.send_file(fd)
+                    else:
+                        with open(message["path"], "rb") as f:
+                            sender.send_response(response_status, response_headers, f.read(), None)
+
+                    response_sent = True
+
+                case "http.response.full":
+                    # tsuno extension: status, headers and body in a single message
+                    if response_started:
+                        raise RuntimeError("Response already started")
+
+                    response_started = True
+                    response_sent = True
+                    response_status = message["status"]
+                    response_headers = self._response_headers(message)
+
+                    sender.send_response(
+                        response_status,
+                        response_headers,
+                        message.get("body", b""),
+                        None,
+                    )
+
                 case "http.disconnect":
                     # Client disconnected
                     pass
 
         try:
             # Call the ASGI application
-            await self.asgi_app(scope, receive, send)
+            await self.http_app(scope, receive, send)
 
             # If no response was sent, send an error
             if not response_sent:
@@ -373,7 +453,7 @@ class ASGIEventLoopWorker:
 
     def _run_lifespan_startup(self) -> None:
         """Run ASGI lifespan startup protocol."""
-        if self.loop is None:
+        if self.loop is None or self.lifespan_app is None:
             return
 
         async def lifespan_startup():
@@ -422,7 +502,7 @@ class ASGIEventLoopWorker:
 
             try:
                 # Run lifespan as background task
-                self.lifespan_task = asyncio.create_task(self.asgi_app(scope, receive, send))
+                self.lifespan_task = asyncio.create_task(self.lifespan_app(scope, receive, send))
                 # Wait for startup to complete (with short timeout)
                 await asyncio.wait_for(
                     self.lifespan_startup_complete.wait(),
@@ -84,7 +84,7 @@ For more information, visit: https://github.com/i2y/tsuno
         "--threads",
         type=int,
         default=2,
-        help="Blocking threads per worker (default: 2)",
+        help="Blocking threads per worker process (default: 2)",
     )
     server_group.add_argument(
         "--tokio-threads",
@@ -372,7 +372,7 @@ def resolve_config(args: argparse.Namespace) -> dict[str, Any]:
 
 def main() -> None:
     """
-    Main entry point for the Qilin CLI.
+    Main entry point for the tsuno CLI.
 
     This function:
     1. Parses command-line arguments
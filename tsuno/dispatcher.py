@@ -10,6 +10,7 @@ from typing import Any
 
 from .access_log import log_request
 from .asgi_adapter import ASGIAdapter
+from .static_response import StaticResponse
 from .wsgi_adapter import WSGIAdapter
 
 
@@ -101,23 +102,33 @@ class Dispatcher:
         # Sort prefix apps by length (longest first) for proper matching
         self.prefix_apps.sort(key=lambda x: len(x[0]), reverse=True)
 
+        # Routing table used per request: (prefix, prefix + "/", adapter) for
+        # sub-path mounts, with the root mount (which matches every path) kept
+        # separately and tried last
+        self._routes = [(prefix, prefix + "/", adapter) for prefix, _, adapter in self.prefix_apps if prefix != "/"]
+        self._root_adapter = next((adapter for prefix, _, adapter in self.prefix_apps if prefix == "/"), None)
+
         # Create adapter for default app if provided
         if self.default_app:
             self.default_adapter = self._create_adapter(self.default_app)
 
-    def _create_adapter(self, app: Any) -> WSGIAdapter | ASGIAdapter:
+    def _create_adapter(self, app: Any) -> WSGIAdapter | ASGIAdapter | StaticResponse:
         """
         Create appropriate adapter for app.
 
         Automatically detects WSGI vs ASGI based on app introspection.
 
         Args:
-            app: WSGI or ASGI application
+            app: WSGI or ASGI application, or a StaticResponse
 
         Returns:
-            WSGIAdapter or ASGIAdapter instance
+            WSGIAdapter or ASGIAdapter instance (StaticResponse is its own adapter)
         """
-        if hasattr(app, "routes"):  # FastAPI/Starlette
+        if isinstance(app, StaticResponse):  # Precomputed response
+            return app
+        elif isinstance(app, dict):  # ASGI handlers per scope type
+            return ASGIAdapter(app, root_path=self.root_path, use_uvloop=self.use_uvloop)
+        elif hasattr(app, "routes"):  # FastAPI/Starlette
             return ASGIAdapter(app, root_path=self.root_path, use_uvloop=self.use_uvloop)
         elif hasattr(app, "wsgi_app"):  # Flask
             return WSGIAdapter(app)
@@ -189,21 +200,8 @@ class Dispatcher:
 
         try:
             # Try prefix matching for WSGI/ASGI apps
-            for prefix, app, adapter in self.prefix_apps:
-                if prefix == "/":
-                    # Root prefix matches everything
-                    if path == "/" or path.startswith("/"):
-                        adjusted_path = path
-                        adapter.handle_request(
-                            sender,
-                            method,
-                            adjusted_path,
-                            headers,
-                            body,
-                            request_receiver,
-                        )
-                        return
-                elif path.startswith(prefix + "/") or path == prefix:
+            for prefix, prefix_slash, adapter in self._routes:
+                if path.startswith(prefix_slash) or path == prefix:
                     # Adjust path by removing prefix
                     adjusted_path = path[len(prefix) :] or "/"
                     adapter.handle_request(
@@ -216,6 +214,11 @@ class Dispatcher:
                     )
                     return
 
+            # Root prefix matches everything else
+            if self._root_adapter is not None and path.startswith("/"):
+                self._root_adapter.handle_request(sender, method, path, headers, body, request_receiver)
+                return
+
             # Try default app
             if self.default_app and self.default_adapter:
                 self.default_adapter.handle_request(sender, method, path, headers, body, request_receiver)
@@ -0,0 +1,79 @@
+"""
+Registered response header sets.
+
+Applications that send the same response headers on every request can
+register them once and refer to them by id. ASGI apps pass the id as
+"headers_id" in http.response.start / http.response.full messages, and the
+headers are handed to the Rust ResponseSender without being decoded again.
+"""
+
+import threading
+
+_registered: list[list[tuple[str, str]]] = []
+_register_lock = threading.Lock()
+
+
+def normalize_headers(headers: list[tuple[bytes | str, bytes | str]]) -> list[tuple[str, str]]:
+    """
+    Convert (name, value) header tuples to the string tuples expected by ResponseSender.
+
+    Args:
+        headers: Header tuples (bytes or str)
+
+    Returns:
+        List of (name, value) string tuples
+    """
+    normalized = []
+    for name, value in headers:
+        if isinstance(name, bytes):
+            name = name.decode("latin-1")
+        if isinstance(value, bytes):
+            value = value.decode("latin-1")
+        normalized.append((name, value))
+    return normalized
+
+
+def register_headers(headers: list[tuple[bytes | str, bytes | str]]) -> int:
+    """
+    Register a response header set and return its id.
+
+    Register headers at import time so every worker process gets the same ids.
+
+    Args:
+        headers: Response headers as (name, value) tuples (bytes or str)
+
+    Returns:
+        Id to send as "headers_id" in ASGI response start messages
+
+    Example:
+        H_PLAIN = register_headers([(b"content-type", b"text/plain")])
+
+        async def app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers_id": H_PLAIN})
+            await send({"type": "http.response.body", "body": b"Hello"})
+    """
+    normalized = normalize_headers(headers)
+    # Assign the id and append atomically (threads run in parallel on free-threaded builds)
+    with _register_lock:
+        _registered.append(normalized)
+        return len(_registered) - 1
+
+
+def get_registered_headers(headers_id: int) -> list[tuple[str, str]]:
+    """
+    Look up a registered header set.
+
+    The returned list is shared and must not be modified.
+
+    Args:
+        headers_id: Id returned by register_headers()
+
+    Returns:
+        List of (name, value) string tuples
+
+    Raises:
+        ValueError: If no header set is registered under headers_id
+    """
+    if not isinstance(headers_id, int) or not 0 <= headers_id < len(_registered):
+        raise ValueError(f"Unknown headers_id: {headers_id!r}")
+    return _registered[headers_id]
@@ -0,0 +1,89 @@
+"""
+Precomputed static responses.
+
+A static response is mounted like any other application but is answered
+directly from the request-handling thread, without scheduling an ASGI task
+or calling into a WSGI application.
+"""
+
+from .headers import normalize_headers
+
+
+class StaticResponse:
+    """
+    Immutable HTTP response served without calling application code.
+
+    Headers are normalized to the string tuples expected by the Rust
+    ResponseSender once, at construction time, so each request is a single
+    send_response() call.
+    """
+
+    __slots__ = ("status", "headers", "body")
+
+    def __init__(
+        self,
+        status: int,
+        headers: list[tuple[bytes | str, bytes | str]],
+        body: bytes,
+    ):
+        """
+        Initialize the static response.
+
+        Args:
+            status: HTTP status code
+            headers: Response headers as (name, value) tuples (bytes or str)
+            body: Response body
+        """
+        normalized = normalize_headers(headers)
+
+        # Body length is known up front, so always send a fixed-length response
+        if not any(name.lower() == "content-length" for name, _ in normalized):
+            normalized.append(("content-length", str(len(body))))
+
+        self.status = status
+        self.headers = normalized
+        self.body = bytes(body)
+
+    def handle_request(
+        self,
+        sender,  # ResponseSender from Rust
+        method: str,
+        path: str,
+        headers: list[tuple[str, str]],
+        body: bytes,
+        request_receiver=None,  # Optional RequestReceiver (not used)
+    ) -> None:
+        """
+        Send the precomputed response.
+
+        Args:
+            sender: ResponseSender object from Rust to send the response
+            method: HTTP method
+            path: Request path
+            headers: Request headers
+            body: Request body
+        """
+        sender.send_response(self.status, self.headers, self.body, None)
+
+
+def static_response(
+    status: int,
+    headers: list[tuple[bytes | str, bytes | str]],
+    body: bytes,
+) -> StaticResponse:
+    """
+    Create a response that is served without entering Python application code.
+
+    Args:
+        status: HTTP status code
+        headers: Response headers as (name, value) tuples (bytes or str)
+        body: Response body
+
+    Returns:
+        StaticResponse that can be mounted with serve()
+
+    Example:
+        hello = static_response(200, [(b"content-type", b"text/plain")], b"Hello, World!")
+        serve({"/": hello})
+    """
+    return StaticResponse(status, headers, body)
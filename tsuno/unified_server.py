@@ -331,6 +331,7 @@ def serve(
     address: str = "0.0.0.0:8000",
     workers: int | None = None,
     blocking_threads: int = 2,
+    single_process_threads: int | None = None,
     tokio_threads: int | None = None,
     enable_worker_restart: bool = True,
     max_restarts_per_worker: int = 5,
@@ -374,11 +375,18 @@ def serve(
                   '/': main_app,            # WSGI/ASGI app
                   '/api': fastapi_app,      # FastAPI app
                   '/admin': flask_app,      # Flask app
+                  '/raw': {'http': http_handler},  # ASGI handlers per scope type
               }
         address: Address to bind to (default: "0.0.0.0:8000")
         workers: Number of worker processes (default: auto-detect based on CPUs/threads)
                  Set to 1 for single-process behavior (useful for debugging)
         blocking_threads: Number of blocking threads per worker (default: 2)
+        single_process_threads: Run a single worker process with this many blocking threads
+                                (overrides workers and blocking_threads). Intended for WSGI apps on
+                                free-threaded Python builds, where the threads run in parallel.
+                                ASGI apps still get one event loop per worker process, so keep
+                                multiple workers for ASGI-heavy workloads. Unlike threads= in run()
+                                and the CLI, this is the total, not a per-worker count
         tokio_threads: Number of Tokio I/O threads (default: 1, optimal for HTTP/1.1)
                        Set to 3 for HTTP/2-heavy workloads
                        Priority: tokio_threads parameter > TOKIO_WORKER_THREADS env var
@@ -412,7 +420,13 @@ def serve(
             '/': flask_app,
             '/api': fastapi_app,
         }, workers=4, blocking_threads=2, graceful_timeout=60, pid_file="/tmp/app.pid")
+
+        # Free-threaded Python (3.13t+): one process, all cores
+        serve(apps, single_process_threads=os.cpu_count())
     """
+    if single_process_threads is not None and single_process_threads < 1:
+        raise ValueError(f"single_process_threads must be at least 1, got {single_process_threads}")
+
     # Daemonize if requested (must be done before any other operations)
     if daemon:
         print("Daemonizing process...", file=sys.stderr, flush=True)
@@ -489,6 +503,18 @@ def serve(
         log_level=log_level or "INFO",
     )
 
+    # Single-process, multi-threaded mode (free-threaded Python builds)
+    if single_process_threads is not None:
+        if workers not in (None, 1):
+            print(
+                f"Warning: single_process_threads={single_process_threads} runs a single worker process, "
+                f"ignoring workers={workers}",
+                file=sys.stderr,
+                flush=True,
+            )
+        workers = 1
+        blocking_threads = single_process_threads
+
     # Auto-detect workers if not specified
     if workers is None:
         cpu_count = multiprocessing.cpu_count()
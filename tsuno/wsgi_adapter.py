@@ -6,11 +6,68 @@ while leveraging the performance benefits of the Rust-based transport layer.
 """
 
 import io
+import os
+import stat
 import sys
 from typing import Any, Callable
 from urllib.parse import unquote, urlsplit
 
 
+class FileWrapper:
+    """
+    wsgi.file_wrapper implementation (PEP 3333).
+
+    Iterating the wrapper yields blocks read from the file, so it is a valid
+    response iterable on its own. When a WSGI application returns a wrapper
+    around a regular file, WSGIAdapter sends the file from Rust instead.
+    """
+
+    def __init__(self, filelike, block_size: int = 8192):
+        """
+        Initialize the file wrapper.
+
+        Args:
+            filelike: File-like object opened in binary mode
+            block_size: Size of the blocks yielded when iterating
+        """
+        self.filelike = filelike
+        self.block_size = block_size
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> bytes:
+        data = self.filelike.read(self.block_size)
+        if data:
+            return data
+        raise StopIteration
+
+    def close(self) -> None:
+        """Close the wrapped file."""
+        if hasattr(self.filelike, "close"):
+            self.filelike.close()
+
+    def file_descriptor(self) -> int | None:
+        """
+        Return a duplicate descriptor of the wrapped file if it can be sent from disk.
+
+        Only regular files still positioned at the start qualify; anything else
+        (in-memory buffers, pipes, partially read files) is iterated instead.
+        The caller owns the returned descriptor.
+        """
+        if os.name != "posix":
+            return None
+        try:
+            fd = self.filelike.fileno()
+            if not stat.S_ISREG(os.fstat(fd).st_mode):
+                return None
+            if self.filelike.tell() != 0 or os.lseek(fd, 0, os.SEEK_CUR) != 0:
+                return None
+            return os.dup(fd)
+        except (AttributeError, OSError, ValueError):
+            return None
+
+
 class WSGIAdapter:
     """Adapter to serve WSGI applications using the high-performance server."""
 
@@ -23,6 +80,22 @@ class WSGIAdapter:
         """
         self.wsgi_app = wsgi_app
 
+        # environ keys that are the same for every request; _build_environ()
+        # copies this dict and fills in the per-request keys
+        self._environ_template: dict[str, Any] = {
+            # WSGI required variables
+            "SCRIPT_NAME": "",
+            "CONTENT_TYPE": "",
+            "CONTENT_LENGTH": "",
+            "SERVER_PROTOCOL": "HTTP/1.1",
+            "wsgi.version": (1, 0),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+            "wsgi.file_wrapper": FileWrapper,
+        }
+
     def _build_environ(
         self,
         method: str,
@@ -61,31 +134,20 @@ class WSGIAdapter:
             client_host = client_address[0]
             client_port = str(client_address[1])
 
-        # Create the base environ
-        environ = {
-            # WSGI required variables
-            "REQUEST_METHOD": method,
-            "SCRIPT_NAME": "",
-            "PATH_INFO": path_info,
-            "QUERY_STRING": query_string,
-            "CONTENT_TYPE": "",
-            "CONTENT_LENGTH": "",
-            "SERVER_NAME": server_address[0],
-            "SERVER_PORT": str(server_address[1]),
-            "SERVER_PROTOCOL": "HTTP/1.1",
-            "wsgi.version": (1, 0),
-            "wsgi.url_scheme": url_scheme,
-            "wsgi.input": io.BytesIO(body),
-            "wsgi.errors": sys.stderr,
-            "wsgi.multithread": True,
-            "wsgi.multiprocess": True,
-            "wsgi.run_once": False,
-            # Additional CGI variables
-            "REMOTE_ADDR": client_host,
-            "REMOTE_HOST": client_host,
-            "REMOTE_PORT": client_port,
-            "HTTP_HOST": f"{server_address[0]}:{server_address[1]}",
-        }
+        # Create the base environ from the constant template
+        environ = self._environ_template.copy()
+        environ["REQUEST_METHOD"] = method
+        environ["PATH_INFO"] = path_info
+        environ["QUERY_STRING"] = query_string
+        environ["SERVER_NAME"] = server_address[0]
+        environ["SERVER_PORT"] = str(server_address[1])
+        environ["wsgi.url_scheme"] = url_scheme
+        environ["wsgi.input"] = io.BytesIO(body)
+        # Additional CGI variables
+        environ["REMOTE_ADDR"] = client_host
+        environ["REMOTE_HOST"] = client_host
+        environ["REMOTE_PORT"] = client_port
+        environ["HTTP_HOST"] = f"{server_address[0]}:{server_address[1]}"
 
         # Process headers
         content_length = len(body) if body else 0
@@ -212,6 +274,25 @@ class WSGIAdapter:
             # Call the WSGI application
             app_iter = self.wsgi_app(environ, start_response)
 
+            # Files returned through wsgi.file_wrapper are read by the server
+            # directly instead of being iterated block by block in Python
+            # The file is opened before the headers go out, so a file that
+            # cannot be sent falls back to iterating the wrapper
+            if isinstance(app_iter, FileWrapper) and response_started and not response_body:
+                fd = app_iter.file_descriptor()
+                if fd is not None:
+                    try:
+                        try:
+                            sender.send_start(response_status, response_headers)
+                        except BaseException:
+                            os.close(fd)
+                            raise
+                        # The sender takes ownership of fd
+                        sender.send_file(fd)
+                    finally:
+                        app_iter.close()
+                    return
+
             # Collect response body
             try:
                 for data in app_iter:
@@ -225,6 +306,16 @@ class WSGIAdapter:
             # Combine response body
             full_body = b"".join(response_body)
 
+            # The body is fully buffered, so send it with a fixed length instead
+            # of chunked framing when the application did not set Content-Length
+            if (
+                method != "HEAD"
+                and response_status >= 200
+                and response_status not in (204, 304)
+                and not any(name.lower() in ("content-length", "transfer-encoding") for name, _ in response_headers)
+            ):
+                response_headers = [*response_headers, ("Content-Length", str(len(full_body)))]
+
             # Send response via ResponseSender
             sender.send_response(response_status, response_headers, full_body, None)
 